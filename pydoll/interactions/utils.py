@@ -32,20 +32,23 @@ class CubicBezier:
             + self.coefficient_c_y
         ) * time_progress
 
-    def sample_curve_derivative_x(self, time_progress: float) -> float:
-        return (
-            3.0 * self.coefficient_a_x * time_progress + 2.0 * self.coefficient_b_x
-        ) * time_progress + self.coefficient_c_x
-
     def solve_curve_x(self, target_x: float, epsilon: float = 1e-6) -> float:
         """Given an x value, find the corresponding t value."""
         estimated_t = target_x
+        coefficient_a_x = self.coefficient_a_x
+        coefficient_b_x = self.coefficient_b_x
+        coefficient_c_x = self.coefficient_c_x
 
+        # Newton-Raphson on x(t) - target_x, with x(t) and x'(t) inlined.
         for _ in range(8):
-            current_x = self.sample_curve_x(estimated_t) - target_x
+            current_x = (
+                (coefficient_a_x * estimated_t + coefficient_b_x) * estimated_t + coefficient_c_x
+            ) * estimated_t - target_x
             if abs(current_x) < epsilon:
                 return estimated_t
-            derivative = self.sample_curve_derivative_x(estimated_t)
+            derivative = (
+                3.0 * coefficient_a_x * estimated_t + 2.0 * coefficient_b_x
+            ) * estimated_t + coefficient_c_x
             if abs(derivative) < epsilon:
                 break
             estimated_t -= current_x / derivative
@@ -141,27 +144,27 @@ def random_control_points(
     if distance < 1.0:
         return (start, end)
 
-    perp = (-dy / distance, dx / distance)
+    inverse_distance = 1.0 / distance
+    perp = (-dy * inverse_distance, dx * inverse_distance)
+    uniform = random.uniform
 
-    scale = min(1.0, distance / short_distance_threshold)
-    offsets = (
-        random.uniform(curvature_min, curvature_max) * distance * scale,
-        random.uniform(curvature_min, curvature_max) * distance * scale,
-    )
+    amplitude = distance * min(1.0, distance / short_distance_threshold)
+    offset1 = uniform(curvature_min, curvature_max) * amplitude
+    offset2 = uniform(curvature_min, curvature_max) * amplitude
 
     sign = random.choice([-1.0, 1.0])
-    t1 = random.uniform(0.2, curvature_asymmetry)
-    t2 = random.uniform(curvature_asymmetry, 0.8)
+    t1 = uniform(0.2, curvature_asymmetry)
+    t2 = uniform(curvature_asymmetry, 0.8)
 
     cp1 = (
-        start[0] + dx * t1 + perp[0] * offsets[0] * sign,
-        start[1] + dy * t1 + perp[1] * offsets[0] * sign,
+        start[0] + dx * t1 + perp[0] * offset1 * sign,
+        start[1] + dy * t1 + perp[1] * offset1 * sign,
     )
 
-    counter = random.uniform(0.3, 1.0)
+    counter = uniform(0.3, 1.0)
     cp2 = (
-        start[0] + dx * t2 + perp[0] * offsets[1] * sign * counter,
-        start[1] + dy * t2 + perp[1] * offsets[1] * sign * counter,
+        start[0] + dx * t2 + perp[0] * offset2 * sign * counter,
+        start[1] + dy * t2 + perp[1] * offset2 * sign * counter,
     )
 
     return (cp1, cp2)
@@ -1,10 +1,16 @@
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 
 from pydoll.protocol.emulation.types import UserAgentBrandVersion, UserAgentMetadata
 
 _CHROME_RE = re.compile(r'Chrome/(\d+)\.(\d+)\.(\d+)\.(\d+)')
 _EDGE_RE = re.compile(r'Edg/(\d+)\.(\d+)\.(\d+)\.(\d+)')
+_WINDOWS_NT_RE = re.compile(r'Windows NT (\d+\.\d+)')
+_MAC_VERSION_RE = re.compile(r'Mac OS X (\d+)[_.](\d+)[_.]?(\d+)?')
+_IOS_VERSION_RE = re.compile(r'OS (\d+)[_.](\d+)[_.]?(\d+)?')
+_ANDROID_VERSION_RE = re.compile(r'Android (\d+(?:\.\d+)*)')
+_MODEL_RE = re.compile(r';\s*([A-Za-z0-9_ ]+)\s*Build/')
 
 _GREASE_BRANDS = [
     'Not/A)Brand',
@@ -74,20 +80,32 @@ _OS_KEYWORDS = [
     ('linux', 'linux'),
 ]
 
-_MOBILE_KEYWORDS = frozenset({'mobile', 'android', 'iphone', 'ipad'})
-
-_VERSION_PATTERNS = {
-    'windows': (r'Windows NT (\d+\.\d+)', None),
-    'macintosh': (r'Mac OS X (\d+)[_.](\d+)[_.]?(\d+)?', None),
-    'android': (r'Android (\d+(?:\.\d+)*)', None),
-    'iphone': (r'OS (\d+)[_.](\d+)[_.]?(\d+)?', None),
-    'ipad': (r'OS (\d+)[_.](\d+)[_.]?(\d+)?', None),
+_DOTTED_VERSION_PATTERNS = {
+    'macintosh': _MAC_VERSION_RE,
+    'iphone': _IOS_VERSION_RE,
+    'ipad': _IOS_VERSION_RE,
 }
 
+_NAVIGATOR_OVERRIDE_JS = (
+    '(function () {\n'
+    '  var proto = Object.getPrototypeOf(navigator);\n'
+    "  try { if ('vendor' in navigator) { Object.defineProperty(proto, 'vendor', "
+    "{get: function () { return '%(vendor)s'; }, configurable: true}); } } catch (e) {}\n"
+    "  try { if ('appVersion' in navigator) { Object.defineProperty(proto, 'appVersion', "
+    "{get: function () { return '%(appVersion)s'; }, configurable: true}); } } catch (e) {}\n"
+    "  try { if ('platform' in navigator) { Object.defineProperty(proto, 'platform', "
+    "{get: function () { return '%(platform)s'; }, configurable: true}); } } catch (e) {}\n"
+    '})();'
+)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedUserAgent:
-    """Result of parsing a User-Agent string into consistent metadata."""
+    """Result of parsing a User-Agent string into consistent metadata.
+
+    Fields cannot be reassigned. ``UserAgentParser.parse`` hands each caller
+    its own copy of ``user_agent_metadata``, which is a plain mutable dict.
+    """
 
     platform: str
     vendor: str
@@ -112,6 +130,10 @@ class UserAgentParser:
     def parse(user_agent: str) -> ParsedUserAgent:
         """Parse a User-Agent string into consistent browser metadata.
 
+        Parsing is cached per User-Agent string (one call per tab or worker).
+        Each call gets its own copy of ``user_agent_metadata``, so callers may
+        modify it without affecting later results.
+
         Args:
             user_agent: Full User-Agent string.
 
@@ -119,9 +141,19 @@ class UserAgentParser:
             ParsedUserAgent with platform, vendor, appVersion,
             userAgentMetadata, and JS override script.
         """
-        os_key = UserAgentParser._detect_os_key(user_agent)
+        parsed = UserAgentParser._parse_cached(user_agent)
+        return replace(
+            parsed,
+            user_agent_metadata=UserAgentParser._copy_metadata(parsed.user_agent_metadata),
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_cached(user_agent: str) -> ParsedUserAgent:
+        ua_lower = user_agent.lower()
+        os_key = UserAgentParser._detect_os_key(ua_lower)
         browser_name, major_version, full_version = UserAgentParser._detect_browser(user_agent)
-        is_mobile = UserAgentParser._detect_mobile(user_agent)
+        is_mobile = UserAgentParser._detect_mobile(ua_lower)
         metadata = UserAgentParser._build_metadata(
             user_agent, os_key, browser_name, major_version, full_version, is_mobile
         )
@@ -139,6 +171,15 @@ class UserAgentParser:
             ),
         )
 
+    @staticmethod
+    def _copy_metadata(metadata: UserAgentMetadata) -> UserAgentMetadata:
+        copied = metadata.copy()
+        if 'brands' in metadata:
+            copied['brands'] = [brand.copy() for brand in metadata['brands']]
+        if 'fullVersionList' in metadata:
+            copied['fullVersionList'] = [brand.copy() for brand in metadata['fullVersionList']]
+        return copied
+
     @staticmethod
     def _build_metadata(
         user_agent: str,
@@ -148,21 +189,20 @@ class UserAgentParser:
         full_version: str,
         is_mobile: bool,
     ) -> UserAgentMetadata:
-        return UserAgentMetadata(
-            platform=_UA_PLATFORM_MAP.get(os_key, 'Windows'),
-            platformVersion=UserAgentParser._get_platform_version(user_agent, os_key),
-            architecture=_ARCHITECTURE_MAP.get(os_key, 'x86'),
-            model=UserAgentParser._extract_model(user_agent) if is_mobile else '',
-            mobile=is_mobile,
-            brands=UserAgentParser._build_brands(browser_name, major_version),
-            fullVersionList=UserAgentParser._build_full_version_list(browser_name, full_version),
-            bitness='64',
-            wow64=False,
-        )
+        return {
+            'platform': _UA_PLATFORM_MAP.get(os_key, 'Windows'),
+            'platformVersion': UserAgentParser._get_platform_version(user_agent, os_key),
+            'architecture': _ARCHITECTURE_MAP.get(os_key, 'x86'),
+            'model': UserAgentParser._extract_model(user_agent) if is_mobile else '',
+            'mobile': is_mobile,
+            'brands': UserAgentParser._build_brands(browser_name, major_version),
+            'fullVersionList': UserAgentParser._build_full_version_list(browser_name, full_version),
+            'bitness': '64',
+            'wow64': False,
+        }
 
     @staticmethod
-    def _detect_os_key(user_agent: str) -> str:
-        ua_lower = user_agent.lower()
+    def _detect_os_key(ua_lower: str) -> str:
         for keyword, os_key in _OS_KEYWORDS:
             if keyword in ua_lower:
                 return os_key
@@ -185,15 +225,17 @@ class UserAgentParser:
         return 'Google Chrome', '120', '120.0.0.0'
 
     @staticmethod
-    def _detect_mobile(user_agent: str) -> bool:
-        ua_lower = user_agent.lower()
-        return any(keyword in ua_lower for keyword in _MOBILE_KEYWORDS)
+    def _detect_mobile(ua_lower: str) -> bool:
+        return (
+            'mobile' in ua_lower
+            or 'android' in ua_lower
+            or 'iphone' in ua_lower
+            or 'ipad' in ua_lower
+        )
 
     @staticmethod
     def _build_app_version(user_agent: str) -> str:
-        if user_agent.startswith('Mozilla/'):
-            return user_agent[len('Mozilla/') :]
-        return user_agent
+        return user_agent.removeprefix('Mozilla/')
 
     @staticmethod
     def _get_platform_version(user_agent: str, os_key: str) -> str:
@@ -202,26 +244,26 @@ class UserAgentParser:
         if os_key == 'windows':
             return UserAgentParser._parse_windows_version(user_agent, default)
 
-        if os_key in {'macintosh', 'iphone', 'ipad'}:
-            pattern = _VERSION_PATTERNS[os_key][0]
+        pattern = _DOTTED_VERSION_PATTERNS.get(os_key)
+        if pattern is not None:
             return UserAgentParser._parse_dotted_version(user_agent, pattern, default)
 
         if os_key == 'android':
-            match = re.search(r'Android (\d+(?:\.\d+)*)', user_agent)
+            match = _ANDROID_VERSION_RE.search(user_agent)
             return match.group(1) if match else default
 
         return default
 
     @staticmethod
     def _parse_windows_version(user_agent: str, default: str) -> str:
-        match = re.search(r'Windows NT (\d+\.\d+)', user_agent)
+        match = _WINDOWS_NT_RE.search(user_agent)
         if not match:
             return default
         return _WINDOWS_VERSION_MAP.get(match.group(1), '15.0.0')
 
     @staticmethod
-    def _parse_dotted_version(user_agent: str, pattern: str, default: str) -> str:
-        match = re.search(pattern, user_agent)
+    def _parse_dotted_version(user_agent: str, pattern: re.Pattern[str], default: str) -> str:
+        match = pattern.search(user_agent)
         if not match:
             return default
         major = match.group(1)
@@ -275,7 +317,7 @@ class UserAgentParser:
 
     @staticmethod
     def _extract_model(user_agent: str) -> str:
-        match = re.search(r';\s*([A-Za-z0-9_ ]+)\s*Build/', user_agent)
+        match = _MODEL_RE.search(user_agent)
         if match:
             return match.group(1).strip()
         return ''
@@ -290,18 +332,12 @@ class UserAgentParser:
         introducing anomalies such as navigator.vendor on WorkerNavigator,
         which does not expose it.
         """
-        overrides = {
-            'vendor': vendor,
-            'appVersion': app_version,
-            'platform': platform,
+        return _NAVIGATOR_OVERRIDE_JS % {
+            'vendor': UserAgentParser._escape_js_string(vendor),
+            'appVersion': UserAgentParser._escape_js_string(app_version),
+            'platform': UserAgentParser._escape_js_string(platform),
         }
-        lines = ['(function () {', '  var proto = Object.getPrototypeOf(navigator);']
-        for prop, value in overrides.items():
-            safe_value = value.replace('\\', '\\\\').replace("'", "\\'")
-            lines.append(
-                f"  try {{ if ('{prop}' in navigator) {{ Object.defineProperty(proto, "
-                f"'{prop}', {{get: function () {{ return '{safe_value}'; }}, "
-                f'configurable: true}}); }} }} catch (e) {{}}'
-            )
-        lines.append('})();')
-        return '\n'.join(lines)
+
+    @staticmethod
+    def _escape_js_string(value: str) -> str:
+        return value.replace('\\', '\\\\').replace("'", "\\'")
@@ -5,9 +5,7 @@ import pytest
 from pydoll.browser.options import ChromiumOptions as Options
 
 
-@pytest.fixture
-def ci_chrome_options():
-    """Chrome options optimized for CI environments."""
+def _build_ci_chrome_options() -> Options:
     options = Options()
     options.headless = True
     options.start_timeout = 60  # Increased timeout for CI
@@ -28,3 +26,14 @@ def ci_chrome_options():
 
     return options
 
+
+@pytest.fixture
+def ci_chrome_options():
+    """Chrome options optimized for CI environments."""
+    return _build_ci_chrome_options()
+
+
+@pytest.fixture(scope='module')
+def module_ci_chrome_options():
+    """CI Chrome options for module-scoped browser fixtures."""
+    return _build_ci_chrome_options()
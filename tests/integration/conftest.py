@@ -142,3 +142,16 @@ async def fake_tab(cdp_server):
         yield tab
     finally:
         await handler.close()
+
+
+@pytest_asyncio.fixture(scope='module', loop_scope='module')
+async def shared_tab(module_ci_chrome_options):
+    """One started Chrome tab reused by every test in a module.
+
+    Browser startup dominates the wall time of short UI tests, so modules whose
+    tests only need a fresh page (not a fresh browser) share this tab and
+    navigate at the start of each test to reset page state. Tests using it must
+    run on the module event loop: ``pytestmark = pytest.mark.asyncio(loop_scope='module')``.
+    """
+    async with Chrome(options=module_ci_chrome_options) as browser:
+        yield await browser.start()
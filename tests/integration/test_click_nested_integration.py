@@ -3,198 +3,166 @@
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 from _waits import wait_for_element_text
 
-from pydoll.browser.chromium import Chrome
 from pydoll.elements.web_element import WebElement
 
 TEST_PAGE = f'file://{(Path(__file__).parent / "pages" / "test_click_nested.html").absolute()}'
 
+pytestmark = pytest.mark.asyncio(loop_scope='module')
 
-class TestClickRegularElement:
-    """Baseline: click() on a normal page element."""
-
-    @pytest.mark.asyncio
-    async def test_click_regular_button(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
 
-            btn = await tab.find(id='regular-btn', timeout=5)
-            counter = await tab.find(id='regular-btn-count')
+# The class-scoped fixtures below load TEST_PAGE once per class and hand out
+# the resolved shadow root. Tests sharing one only touch disjoint nodes, so a
+# click in one test never changes what another one reads.
+@pytest_asyncio.fixture(scope='class', loop_scope='module')
+async def shadow_root(shared_tab):
+    await shared_tab.go_to(TEST_PAGE)
+    host = await shared_tab.find(id='shadow-host', timeout=5)
+    return await host.get_shadow_root()
 
-            text_before = await counter.text
-            assert text_before == '0'
 
-            await btn.click()
-            await wait_for_element_text(counter, '1')
-
-            text_after = await counter.text
-            assert text_after == '1'
+@pytest_asyncio.fixture(scope='class', loop_scope='module')
+async def nested_shadow_roots(shared_tab):
+    await shared_tab.go_to(TEST_PAGE)
+    outer_host = await shared_tab.find(id='nested-shadow-host', timeout=5)
+    outer_shadow = await outer_host.get_shadow_root()
+    inner_host = await outer_shadow.query('#inner-shadow-host')
+    return outer_shadow, await inner_host.get_shadow_root()
 
-    @pytest.mark.asyncio
-    async def test_click_regular_button_multiple_times(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
 
-            btn = await tab.find(id='regular-btn', timeout=5)
-            counter = await tab.find(id='regular-btn-count')
+@pytest_asyncio.fixture(scope='class', loop_scope='module')
+async def iframe_shadow_root(shared_tab):
+    await shared_tab.go_to(TEST_PAGE)
+    iframe = await shared_tab.find(id='test-iframe', timeout=5)
+    shadow_host = await iframe.find(id='shadow-host-in-iframe', timeout=5)
+    return await shadow_host.get_shadow_root()
 
-            for _ in range(3):
-                await btn.click()
 
-            await wait_for_element_text(counter, '3')
+class TestClickRegularElement:
+    """Baseline: click() on a normal page element."""
 
-            text = await counter.text
-            assert text == '3'
+    async def test_click_regular_button(self, shared_tab):
+        await shared_tab.go_to(TEST_PAGE)
 
+        btn = await shared_tab.find(id='regular-btn', timeout=5)
+        counter = await shared_tab.find(id='regular-btn-count')
 
-class TestClickInShadowRoot:
-    """click() on elements inside a shadow root."""
+        text_before = await counter.text
+        assert text_before == '0'
 
-    @pytest.mark.asyncio
-    async def test_click_button_in_shadow_root(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
+        await btn.click()
+        await wait_for_element_text(counter, '1')
 
-            host = await tab.find(id='shadow-host', timeout=5)
-            shadow = await host.get_shadow_root()
+        text_after = await counter.text
+        assert text_after == '1'
 
-            btn = await shadow.query('#shadow-btn')
-            counter = await shadow.query('#shadow-btn-count')
+    async def test_click_regular_button_multiple_times(self, shared_tab):
+        await shared_tab.go_to(TEST_PAGE)
 
-            text_before = await counter.text
-            assert text_before == '0'
+        btn = await shared_tab.find(id='regular-btn', timeout=5)
+        counter = await shared_tab.find(id='regular-btn-count')
 
+        for _ in range(3):
             await btn.click()
-            await wait_for_element_text(counter, '1')
 
-            text_after = await counter.text
-            assert text_after == '1'
+        await wait_for_element_text(counter, '3')
 
-    @pytest.mark.asyncio
-    async def test_find_text_in_shadow_root(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
+        text = await counter.text
+        assert text == '3'
 
-            host = await tab.find(id='shadow-host', timeout=5)
-            shadow = await host.get_shadow_root()
 
-            text_el = await shadow.query('.shadow-text')
-            assert isinstance(text_el, WebElement)
-            text = await text_el.text
-            assert text == 'Content inside shadow root'
+class TestClickInShadowRoot:
+    """click() on elements inside a shadow root."""
 
+    async def test_click_button_in_shadow_root(self, shadow_root):
+        btn = await shadow_root.query('#shadow-btn')
+        counter = await shadow_root.query('#shadow-btn-count')
 
-class TestClickInNestedShadowRoots:
-    """click() on elements inside nested shadow roots (outer open -> inner closed)."""
+        text_before = await counter.text
+        assert text_before == '0'
+
+        await btn.click()
+        await wait_for_element_text(counter, '1')
 
-    @pytest.mark.asyncio
-    async def test_click_button_in_nested_shadow(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
+        text_after = await counter.text
+        assert text_after == '1'
 
-            outer_host = await tab.find(id='nested-shadow-host', timeout=5)
-            outer_shadow = await outer_host.get_shadow_root()
+    async def test_find_text_in_shadow_root(self, shadow_root):
+        text_el = await shadow_root.query('.shadow-text')
+        assert isinstance(text_el, WebElement)
+        text = await text_el.text
+        assert text == 'Content inside shadow root'
 
-            inner_host = await outer_shadow.query('#inner-shadow-host')
-            inner_shadow = await inner_host.get_shadow_root()
 
-            btn = await inner_shadow.query('#deep-btn')
-            counter = await inner_shadow.query('#deep-btn-count')
+class TestClickInNestedShadowRoots:
+    """click() on elements inside nested shadow roots (outer open -> inner closed)."""
 
-            text_before = await counter.text
-            assert text_before == '0'
+    async def test_click_button_in_nested_shadow(self, nested_shadow_roots):
+        _, inner_shadow = nested_shadow_roots
 
-            await btn.click()
-            await wait_for_element_text(counter, '1')
+        btn = await inner_shadow.query('#deep-btn')
+        counter = await inner_shadow.query('#deep-btn-count')
 
-            text_after = await counter.text
-            assert text_after == '1'
+        text_before = await counter.text
+        assert text_before == '0'
 
-    @pytest.mark.asyncio
-    async def test_find_text_in_nested_shadow(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
+        await btn.click()
+        await wait_for_element_text(counter, '1')
 
-            outer_host = await tab.find(id='nested-shadow-host', timeout=5)
-            outer_shadow = await outer_host.get_shadow_root()
+        text_after = await counter.text
+        assert text_after == '1'
 
-            outer_text = await outer_shadow.query('.outer-text')
-            assert 'Outer shadow content' == await outer_text.text
+    async def test_find_text_in_nested_shadow(self, nested_shadow_roots):
+        outer_shadow, inner_shadow = nested_shadow_roots
 
-            inner_host = await outer_shadow.query('#inner-shadow-host')
-            inner_shadow = await inner_host.get_shadow_root()
+        outer_text = await outer_shadow.query('.outer-text')
+        assert 'Outer shadow content' == await outer_text.text
 
-            inner_text = await inner_shadow.query('.inner-text')
-            assert 'Inner shadow content' == await inner_text.text
+        inner_text = await inner_shadow.query('.inner-text')
+        assert 'Inner shadow content' == await inner_text.text
 
 
 class TestClickInIframe:
     """click() on elements inside an iframe."""
 
-    @pytest.mark.asyncio
-    async def test_click_button_in_iframe(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
+    async def test_click_button_in_iframe(self, shared_tab):
+        await shared_tab.go_to(TEST_PAGE)
 
-            iframe = await tab.find(id='test-iframe', timeout=5)
-            assert iframe.is_iframe
+        iframe = await shared_tab.find(id='test-iframe', timeout=5)
+        assert iframe.is_iframe
 
-            btn = await iframe.find(id='iframe-btn', timeout=5)
-            counter = await iframe.find(id='iframe-btn-count')
+        btn = await iframe.find(id='iframe-btn', timeout=5)
+        counter = await iframe.find(id='iframe-btn-count')
 
-            text_before = await counter.text
-            assert text_before == '0'
+        text_before = await counter.text
+        assert text_before == '0'
 
-            await btn.click()
-            await wait_for_element_text(counter, '1')
+        await btn.click()
+        await wait_for_element_text(counter, '1')
 
-            text_after = await counter.text
-            assert text_after == '1'
+        text_after = await counter.text
+        assert text_after == '1'
 
 
 class TestClickInShadowRootInsideIframe:
     """click() on elements in a shadow root that lives inside an iframe."""
 
-    @pytest.mark.asyncio
-    async def test_click_shadow_button_inside_iframe(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
-
-            iframe = await tab.find(id='test-iframe', timeout=5)
-            shadow_host = await iframe.find(id='shadow-host-in-iframe', timeout=5)
-            shadow = await shadow_host.get_shadow_root()
-
-            btn = await shadow.query('#shadow-btn-in-iframe')
-            counter = await shadow.query('#shadow-btn-count')
-
-            text_before = await counter.text
-            assert text_before == '0'
-
-            await btn.click()
-            await wait_for_element_text(counter, '1')
+    async def test_click_shadow_button_inside_iframe(self, iframe_shadow_root):
+        btn = await iframe_shadow_root.query('#shadow-btn-in-iframe')
+        counter = await iframe_shadow_root.query('#shadow-btn-count')
 
-            text_after = await counter.text
-            assert text_after == '1'
+        text_before = await counter.text
+        assert text_before == '0'
 
-    @pytest.mark.asyncio
-    async def test_find_text_in_shadow_inside_iframe(self, ci_chrome_options):
-        async with Chrome(options=ci_chrome_options) as browser:
-            tab = await browser.start()
-            await tab.go_to(TEST_PAGE)
+        await btn.click()
+        await wait_for_element_text(counter, '1')
 
-            iframe = await tab.find(id='test-iframe', timeout=5)
-            shadow_host = await iframe.find(id='shadow-host-in-iframe', timeout=5)
-            shadow = await shadow_host.get_shadow_root()
+        text_after = await counter.text
+        assert text_after == '1'
 
-            text_el = await shadow.query('.shadow-text')
-            text = await text_el.text
-            assert text == 'Shadow content inside iframe'
+    async def test_find_text_in_shadow_inside_iframe(self, iframe_shadow_root):
+        text_el = await iframe_shadow_root.query('.shadow-text')
+        text = await text_el.text
+        assert text == 'Shadow content inside iframe'
@@ -172,20 +172,22 @@ def test_dict_prefs():
     assert options.browser_preferences['download']['directory_upgrade'] == True
 
 
-def test_not_dict_prefs_error():
-    with pytest.raises(ValueError, match='The experimental options value must be a dict.'):
-        options = Options()
-        options.browser_preferences = ["download", "directory_upgrade"]
-
-
-def test_wrong_dict_prefs_error():
-    with pytest.raises(WrongPrefsDict):
-        options = Options()
-        options.browser_preferences = {
-            'prefs': {
-                "download": {"directory_upgrade": True},
-            }
-        }
+@pytest.mark.parametrize(
+    'prefs, expected_exception, match',
+    [
+        (
+            ["download", "directory_upgrade"],
+            ValueError,
+            'The experimental options value must be a dict.',
+        ),
+        ({'prefs': {"download": {"directory_upgrade": True}}}, WrongPrefsDict, None),
+    ],
+    ids=['not_dict', 'wrong_dict'],
+)
+def test_invalid_prefs_error(prefs, expected_exception, match):
+    options = Options()
+    with pytest.raises(expected_exception, match=match):
+        options.browser_preferences = prefs
 
 def test_set_arguments():
     options = Options()
@@ -29,6 +29,12 @@ def test_cubic_bezier_is_monotonic_within_unit_interval():
     assert all(0.0 <= value <= 1.0 for value in samples)
 
 
+def test_cubic_bezier_solve_curve_x_inverts_sampled_curve():
+    curve = CubicBezier(0.42, 0.0, 0.58, 1.0)
+    for x in (0.1, 0.3, 0.5, 0.7, 0.9):
+        assert curve.sample_curve_x(curve.solve_curve_x(x)) == pytest.approx(x, abs=1e-6)
+
+
 def test_minimum_jerk_endpoints_and_midpoint():
     assert minimum_jerk(0.0) == pytest.approx(0.0)
     assert minimum_jerk(1.0) == pytest.approx(1.0)
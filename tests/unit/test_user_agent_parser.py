@@ -5,6 +5,8 @@ Verifies that User-Agent strings are parsed into consistent metadata
 for CDP Emulation.setUserAgentOverride and navigator JS overrides.
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from pydoll.utils.user_agent_parser import UserAgentParser, ParsedUserAgent
@@ -371,6 +373,29 @@ class TestEdgeCases:
         result = UserAgentParser.parse(ua)
         assert result.app_version == ua
 
+    def test_parse_is_cached_per_user_agent(self):
+        cached = UserAgentParser._parse_cached(CHROME_WINDOWS_UA)
+        assert UserAgentParser._parse_cached(CHROME_WINDOWS_UA) is cached
+        assert UserAgentParser._parse_cached(CHROME_MACOS_UA) is not cached
+
+    def test_parse_metadata_changes_do_not_leak_into_cache(self):
+        first = UserAgentParser.parse(CHROME_WINDOWS_UA)
+        first.user_agent_metadata['brands'][0]['brand'] = 'Tampered'
+        first.user_agent_metadata['brands'].clear()
+        first.user_agent_metadata['fullVersionList'].clear()
+        first.user_agent_metadata['platform'] = 'Tampered'
+
+        second = UserAgentParser.parse(CHROME_WINDOWS_UA)
+        assert second.user_agent_metadata['platform'] == 'Windows'
+        assert len(second.user_agent_metadata['brands']) == 3
+        assert len(second.user_agent_metadata['fullVersionList']) == 3
+        assert all(b['brand'] != 'Tampered' for b in second.user_agent_metadata['brands'])
+
+    def test_parsed_user_agent_is_immutable(self):
+        result = UserAgentParser.parse(CHROME_WINDOWS_UA)
+        with pytest.raises(FrozenInstanceError):
+            result.platform = 'MacIntel'
+
 
 # --- ChromeOS ---
 
@@ -1,7 +1,6 @@
 import aiohttp
 import pytest
 from aioresponses import aioresponses
-import tempfile
 import os
 import sys
 from unittest.mock import patch
@@ -152,42 +151,40 @@ class TestUtils:
             result = await get_browser_ws_address(port)
             assert result == expected_url
 
-    def test_validate_browser_paths_success(self):
+    def test_validate_browser_paths_success(self, tmp_path):
         """
         Test validate_browser_paths with valid executable path.
         Verifies that the function returns the first valid path found.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary executable file
-            valid_path = os.path.join(temp_dir, f'browser{_EXE}')
-            with open(valid_path, 'w') as f:
-                f.write('#!/bin/bash\necho "browser"')
-            os.chmod(valid_path, 0o755)  # Make it executable
-            
-            invalid_path = '/nonexistent/browser'
-            paths = [invalid_path, valid_path]
-            
-            result = validate_browser_paths(paths)
-            assert result == valid_path
-
-    def test_validate_browser_paths_first_valid_wins(self):
+        # Create a temporary executable file
+        valid_path = os.path.join(tmp_path, f'browser{_EXE}')
+        with open(valid_path, 'w') as f:
+            f.write('#!/bin/bash\necho "browser"')
+        os.chmod(valid_path, 0o755)  # Make it executable
+
+        invalid_path = '/nonexistent/browser'
+        paths = [invalid_path, valid_path]
+
+        result = validate_browser_paths(paths)
+        assert result == valid_path
+
+    def test_validate_browser_paths_first_valid_wins(self, tmp_path):
         """
         Test that validate_browser_paths returns the first valid path.
         Verifies that when multiple valid paths exist, the first one is returned.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create two valid executable files
-            first_valid = os.path.join(temp_dir, f'browser1{_EXE}')
-            second_valid = os.path.join(temp_dir, f'browser2{_EXE}')
-            
-            for path in [first_valid, second_valid]:
-                with open(path, 'w') as f:
-                    f.write('#!/bin/bash\necho "browser"')
-                os.chmod(path, 0o755)
-            
-            paths = [first_valid, second_valid]
-            result = validate_browser_paths(paths)
-            assert result == first_valid
+        # Create two valid executable files
+        first_valid = os.path.join(tmp_path, f'browser1{_EXE}')
+        second_valid = os.path.join(tmp_path, f'browser2{_EXE}')
+
+        for path in [first_valid, second_valid]:
+            with open(path, 'w') as f:
+                f.write('#!/bin/bash\necho "browser"')
+            os.chmod(path, 0o755)
+
+        paths = [first_valid, second_valid]
+        result = validate_browser_paths(paths)
+        assert result == first_valid
 
     def test_validate_browser_paths_no_valid_paths(self):
         """
@@ -207,31 +204,29 @@ class TestUtils:
         assert 'No valid browser path found in:' in str(exc_info.value)
 
     @pytest.mark.skipif(sys.platform.startswith('win'), reason='No executable bit on NTFS on Windows')
-    def test_validate_browser_paths_file_exists_but_not_executable(self):
+    def test_validate_browser_paths_file_exists_but_not_executable(self, tmp_path):
         """
         Test validate_browser_paths with non-executable file.
         Verifies that a file that exists but is not executable is not considered valid.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a file that exists but is not executable
-            non_executable = os.path.join(temp_dir, 'browser')
-            with open(non_executable, 'w') as f:
-                f.write('not executable')
-            # Don't set executable permissions
+        # Create a file that exists but is not executable
+        non_executable = os.path.join(tmp_path, 'browser')
+        with open(non_executable, 'w') as f:
+            f.write('not executable')
+        # Don't set executable permissions
 
-            with pytest.raises(exceptions.InvalidBrowserPath):
-                validate_browser_paths([non_executable])
+        with pytest.raises(exceptions.InvalidBrowserPath):
+            validate_browser_paths([non_executable])
 
     @pytest.mark.skipif(sys.platform.startswith('win'), reason='No executable bit on NTFS on Windows')
-    def test_validate_browser_paths_directory_instead_of_file(self):
+    def test_validate_browser_paths_directory_instead_of_file(self, tmp_path):
         """
         Test validate_browser_paths with a directory path.
         Verifies that directories are not treated as valid executables even if they have execute permission.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            os.chmod(temp_dir, 0o755)
-            with pytest.raises(exceptions.InvalidBrowserPath):
-                validate_browser_paths([temp_dir])
+        os.chmod(tmp_path, 0o755)
+        with pytest.raises(exceptions.InvalidBrowserPath):
+            validate_browser_paths([str(tmp_path)])
 
     def test_validate_browser_paths_empty_list(self):
         """
@@ -242,28 +237,27 @@ class TestUtils:
         with pytest.raises(exceptions.InvalidBrowserPath):
             validate_browser_paths([])
 
-    def test_validate_browser_paths_mixed_valid_invalid(self):
+    def test_validate_browser_paths_mixed_valid_invalid(self, tmp_path):
         """
         Test validate_browser_paths with mix of valid and invalid paths.
         Verifies that the function skips invalid paths and returns the first valid one.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create one valid executable
-            valid_path = os.path.join(temp_dir, f'browser{_EXE}')
-            with open(valid_path, 'w') as f:
-                f.write('#!/bin/bash\necho "browser"')
-            os.chmod(valid_path, 0o755)
-
-            # Mix valid and invalid paths
-            paths = [
-                '/nonexistent/browser1',
-                '/nonexistent/browser2',
-                valid_path,
-                '/nonexistent/browser3'
-            ]
-            
-            result = validate_browser_paths(paths)
-            assert result == valid_path
+        # Create one valid executable
+        valid_path = os.path.join(tmp_path, f'browser{_EXE}')
+        with open(valid_path, 'w') as f:
+            f.write('#!/bin/bash\necho "browser"')
+        os.chmod(valid_path, 0o755)
+
+        # Mix valid and invalid paths
+        paths = [
+            '/nonexistent/browser1',
+            '/nonexistent/browser2',
+            valid_path,
+            '/nonexistent/browser3'
+        ]
+
+        result = validate_browser_paths(paths)
+        assert result == valid_path
 
 
 class TestDecodeBase64ToBytes: